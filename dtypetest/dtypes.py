@@ -1,14 +1,115 @@
+import functools
 import pathlib
-from typing import get_origin, get_args
+from typing import Callable, Final, get_origin, get_args
 from types import UnionType
 import ast
 from typing import Any
 from dtypetest.type_checker import TypeChecker
+from dtypetest.type_mask import names_to_mask, type_bit
+
+# python types that can be given as parameter or return types, and their names used by the type checker
+_ARG_TO_STR: Final[dict[Any, str]] = {
+    int: 'int',
+    str: 'str',
+    float: 'float',
+    bool: 'bool',
+    None: 'None'
+}
+_ARG_TO_STR_GET = _ARG_TO_STR.get
+
+
+def _parse_str_types(arg_types: str) -> int:
+    """
+    _parse_str_types Parses a type given by its name.
+
+    :param arg_types: The name of the type.
+    :type arg_types: str
+    :return: The type mask of the parsed argument types.
+    :rtype: int
+    """
+    return type_bit(arg_types)
+
+
+def _parse_collection_types(arg_types: set | list) -> int:
+    """
+    _parse_collection_types Parses a set or list of types, each given either as a python type or by its name.
+
+    :param arg_types: The argument types.
+    :type arg_types: set | list
+    :raises ValueError: If any of the types is not supported.
+    :return: The type mask of the parsed argument types.
+    :rtype: int
+    """
+    for arg_type in arg_types:
+        if not isinstance(arg_type, str) and arg_type not in _ARG_TO_STR:
+            raise ValueError(f"Unsupported argument type: {arg_type}")
+    return names_to_mask(arg_type if isinstance(arg_type, str) else _ARG_TO_STR[arg_type] for arg_type in arg_types)
+
+
+# parsers for the common kinds of argument types, looked up by the exact type of the given value
+_PARSE_DISPATCH: Final[dict[type, Callable[[Any], int]]] = {
+    str: _parse_str_types,
+    set: _parse_collection_types,
+    list: _parse_collection_types,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_file(path: str, mtime: int) -> ast.Module:
+    """
+    _parse_file Parses a python file. The results are cached, so each version of a file is parsed only once even when it is used by many DTypes objects. The returned AST is shared between callers and must not be modified.
+
+    :param path: Absolute path to the python file.
+    :type path: str
+    :param mtime: Modification time of the file in nanoseconds. It is only used as part of the cache key, so an edited file is parsed again.
+    :type mtime: int
+    :return: The parsed AST of the file.
+    :rtype: ast.Module
+    """
+    with open(path, 'r') as f:
+        return _prune_ast(ast.parse(f.read()))
+
+
+def _prune_ast(tree: ast.Module) -> ast.Module:
+    """
+    _prune_ast Removes the parts of the AST that the type checker never looks at, so every later walk over the AST visits fewer nodes. These are the docstrings and the annotations of function parameters and return values, as types are never inferred from annotations.
+
+    :param tree: The parsed AST. It is modified in place.
+    :type tree: ast.Module
+    :return: The same AST after pruning.
+    :rtype: ast.Module
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            # a docstring is only dropped if it is not the whole body, so the body never becomes empty
+            if len(node.body) > 1 and isinstance(node.body[0], ast.Expr) and isinstance(node.body[0].value, ast.Constant) and isinstance(node.body[0].value.value, str):
+                del node.body[0]
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                node.returns = None
+        elif isinstance(node, ast.arg):
+            node.annotation = None
+    return tree
+
+
+def _load_file(path: pathlib.Path) -> ast.Module:
+    """
+    _load_file Returns the (cached) AST of a python file.
+
+    :param path: Path to the python file.
+    :type path: pathlib.Path
+    :return: The parsed AST of the file.
+    :rtype: ast.Module
+    """
+    # resolved, so a relative path is not cached as the same file under different working directories
+    path = path.resolve()
+    return _parse_file(str(path), path.stat().st_mtime_ns)
 
 class DTypes:
     """
     This is the main class of the package. It is used to get the AST of the entry file, assign function parameter types and then run the type checker.
     """
+    __slots__ = ('entry_file', 'entry_file_dir', 'ast', 'type_assignments')
+
     def __init__(self, entry_file: str) -> None:
         """
         __init__ Gets and stores the AST of the entry file written in Python.
@@ -21,25 +122,28 @@ class DTypes:
         self.entry_file_dir = pathlib.Path(entry_file).parent
         
         # get the AST of the entry file
-        with open(entry_file, 'r') as f:
-            self.ast = ast.parse(f.read())
+        # the cached AST is shared, so a new module is made to add the imported files into
+        self.ast = ast.Module(body=list(_load_file(pathlib.Path(entry_file)).body), type_ignores=[])
             
-        # go through all the local imports and get the AST of the imported files
+        # go through all the local imports and collect the imported files first, so the AST is not extended while it is walked
+        imported_files: list[pathlib.Path] = []
         for node in ast.walk(self.ast):
             if isinstance(node, ast.Import):
                 for alias in node.names:
-                    imported_file = self.entry_file_dir / f"{alias.name}.py"
-                    with open(imported_file, 'r') as f:
-                        imported_ast = ast.parse(f.read())
-                    self.ast.body.extend(imported_ast.body)
+                    imported_files.append(self.entry_file_dir / f"{alias.name}.py")
             elif isinstance(node, ast.ImportFrom):
-                imported_file = self.entry_file_dir / f"{node.module}.py"
-                with open(imported_file, 'r') as f:
-                    imported_ast = ast.parse(f.read())
-                self.ast.body.extend(imported_ast.body)
+                imported_files.append(self.entry_file_dir / f"{node.module}.py")
+
+        # add the AST of each imported file once, even if it is imported multiple times
+        seen: set[pathlib.Path] = set()
+        for imported_file in imported_files:
+            if imported_file in seen:
+                continue
+            seen.add(imported_file)
+            self.ast.body.extend(_load_file(imported_file).body)
         
         # dictionary to store the type assignments of the functions
-        self.type_assignments = {}
+        self.type_assignments: dict[str, dict[str, Any]] = {}
 
     def given(self, func_name: str, param_types: dict[str, Any], return_type: Any) -> None:
         """
@@ -66,59 +170,44 @@ class DTypes:
         if len(func_node.args.args) != len(param_types):
             raise ValueError(f"Number of parameters in the function {func_name} do not match.")
         
+        arg_names = {arg.arg for arg in func_node.args.args}
         for arg_name, arg_type in param_types.items():
-            if not any(arg.arg == arg_name for arg in func_node.args.args):
+            if arg_name not in arg_names:
                 raise ValueError(f"Parameter {arg_name} not found in the function {func_name}.")
             param_types[arg_name] = self._parse_arg_types(arg_type)
         
         # save the types of that function to the type_assignments dictionary
+        # param_items holds the same types in the order of the function parameters, for the type checker to match with call arguments
         self.type_assignments[func_name] = {
             'param_types': param_types,
+            'param_items': tuple((arg.arg, param_types[arg.arg]) for arg in func_node.args.args),
             'return_type': self._parse_arg_types(return_type)
         }
         
-    def _parse_arg_types(self, arg_types: set | list | str) -> set[str]:
+    def _parse_arg_types(self, arg_types: Any) -> int:
         """
         _parse_arg_types Parses the argument types.
 
         :param arg_types: The argument types.
         :type arg_types: Any
-        :return: The parsed argument types.
-        :rtype: set[str]
+        :return: The type mask of the parsed argument types (see :mod:`dtypetest.type_mask`).
+        :rtype: int
         """
-        arg_to_str = {
-            int: 'int',
-            str: 'str',
-            float: 'float',
-            bool: 'bool',
-            None: 'None'
-        }
-        
-        if isinstance(arg_types, str):
-            return {arg_types}
-
-        elif isinstance(arg_types, set) or isinstance(arg_types, list):
-            arg_types = set(arg_types)
-            for arg_type in arg_types:
-                if arg_type not in arg_to_str and not isinstance(arg_type, str):
-                    raise ValueError(f"Unsupported argument type: {arg_type}")
-                if arg_type in arg_to_str:
-                    arg_types.remove(arg_type)
-                    arg_types.add(arg_to_str[arg_type]) # type: ignore
-
-        elif arg_types in arg_to_str:
-            return {arg_to_str[arg_types]}
+        handler = _PARSE_DISPATCH.get(type(arg_types))
+        if handler is not None:
+            return handler(arg_types)
+
+        elif (name := _ARG_TO_STR_GET(arg_types)) is not None:
+            return type_bit(name)
         
         elif get_origin(arg_types) is UnionType:
-            new_arg_types = set()
+            new_arg_types = 0
             for arg in get_args(arg_types):
-                new_arg_types.update(self._parse_arg_types(arg))
-            arg_types = new_arg_types
+                new_arg_types |= self._parse_arg_types(arg)
+            return new_arg_types
             
         else:
             raise ValueError(f"Unsupported argument type: {arg_types}")
-                
-        return arg_types
         
     def run(self) -> None:
         """
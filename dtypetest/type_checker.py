@@ -1,11 +1,111 @@
 import ast
+import bisect
 import pathlib
-from typing import Any
+from collections import defaultdict
+from typing import Any, Final, TypeVar
+from dtypetest.type_mask import ANY_MASK, mask_to_names, type_bit
+
+AssignIndex = defaultdict[str, list[tuple[int, ast.Assign]]]
+
+
+# names of the built-in types of constant values
+_CONST_TYPE_NAMES: Final[dict[type, str]] = {
+    int: 'int',
+    float: 'float',
+    str: 'str',
+    bool: 'bool',
+    type(None): 'None',
+    bytes: 'bytes',
+    list: 'list',
+    tuple: 'tuple',
+    dict: 'dict',
+    set: 'set',
+    frozenset: 'frozenset',
+    complex: 'complex',
+    range: 'range',
+    slice: 'slice',
+    memoryview: 'memoryview',
+    type: 'type',
+}
+
+_CONST_TYPE_BITS: Final[dict[type, int]] = {value_type: type_bit(name) for value_type, name in _CONST_TYPE_NAMES.items()}
+_OBJECT_BIT: Final = type_bit('object')
+_NONE_BIT: Final = type_bit('None')
+
+StmtT = TypeVar('StmtT', bound=ast.stmt)
+
+
+def _last_before(entries: list[tuple[int, StmtT]], line: int) -> tuple[int, StmtT] | None:
+    """
+    _last_before Finds the entry with the greatest line number that is not after the given line.
+
+    :param entries: List of (line number, statement) pairs sorted by line number.
+    :type entries: list[tuple[int, StmtT]]
+    :param line: The line number to search from.
+    :type line: int
+    :return: The matching (line number, statement) pair or None if every entry is after the line.
+    :rtype: tuple[int, StmtT] | None
+    """
+    i = bisect.bisect_right(entries, line, key=lambda entry: entry[0]) - 1
+    return entries[i] if i >= 0 else None
+
+
+class _ArgEvaluator(ast.NodeVisitor):
+    """
+    Infers the type of an expression used inside one function (or the global scope). The node visitor dispatches on the node class, which replaces checking the expression against each supported node type in turn.
+    """
+    def __init__(self, checker: 'TypeChecker', parent_func: ast.FunctionDef | None) -> None:
+        """
+        __init__ The constructor of the _ArgEvaluator class.
+
+        :param checker: The type checker used to look up variable and function return types.
+        :type checker: TypeChecker
+        :param parent_func: The parent function of the evaluated expressions, None for the global scope.
+        :type parent_func: ast.FunctionDef | None
+        """
+        self.checker = checker
+        self.parent_func = parent_func
+
+    def visit_Constant(self, node: ast.Constant) -> int:
+        """
+        visit_Constant Returns the type of a constant value.
+        """
+        return self.checker._get_constant_type(node.value)
+
+    def visit_Name(self, node: ast.Name) -> int:
+        """
+        visit_Name Infers the type of a variable from its assignments or from the calls of the parent function.
+        """
+        return self.checker._find_var_type(node.id, node.lineno, self.parent_func)
+
+    def visit_Call(self, node: ast.Call) -> int:
+        """
+        visit_Call Returns the possible return types of the called function. Only calls by a plain name are supported.
+        """
+        if isinstance(node.func, ast.Name):
+            return self.checker._get_func_return_type(node.func.id)
+        return self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> int:
+        """
+        generic_visit Called for every unsupported expression.
+
+        :raises ValueError: Always, as the type of the expression can not be inferred.
+        """
+        raise ValueError(f"Unsupported variable type: {type(node)}")
+
 
 class TypeChecker:
     """
     This is the class that is responsible for type inference for each variable and function call in the AST.
     """
+    __slots__ = (
+        'ast', 'entry_file_dir', 'type_assignments',
+        '_func_defs', '_class_defs', '_calls_by_name', '_enclosing_func',
+        '_assigns', '_for_loops', '_global_assigns', '_global_for_loops',
+        '_return_type_cache', '_var_type_cache', '_arg_evaluators',
+    )
+
     def __init__(self, code_ast: ast.AST, entry_file_dir: pathlib.Path, type_assignments: dict[str, dict[str, Any]]) -> None:
         """
         __init__ The constructor of the TypeChecker class.
@@ -21,81 +121,122 @@ class TypeChecker:
         self.entry_file_dir = entry_file_dir
         self.type_assignments = type_assignments
         
-        for node in ast.walk(self.ast):
-            node.parent = None
-        self._assign_parents(self.ast)
+        self._index_ast()
+
+        # the AST does not change while checking, so inferred types can be cached
+        self._return_type_cache: dict[str, int] = {}
+        self._var_type_cache: dict[tuple[str, int, ast.FunctionDef | None], int] = {}
+        self._arg_evaluators: dict[ast.FunctionDef | None, _ArgEvaluator] = {}
         
-    def _assign_parents(self, node: ast.AST, parent: ast.AST = None) -> None:
+    def _index_ast(self) -> None:
         """
-        _assign_parents Usually ast nodes do not have a parent attribute. This function assigns the parent attribute to each node in the AST. This helps in traversing the AST and finding parent nodes (e.g. which function I am currently in, etc.).
+        _index_ast Walks the AST once and indexes everything the type checker looks up later. The nodes themselves are not modified, as the ASTs of the parsed files are cached and shared between DTypes objects. The parent of each node and the function it is in are tracked on the traversal stack instead. The indices hold the function definitions, class definitions and function calls by name, and the assignments and for loops of each function body (and the global scope) sorted by line number. The AST does not change after construction, so the lookups can use these indices instead of walking the whole AST again.
 
-        :param node: The current ast node to assign the parent to.
-        :type node: ast.AST
-        :param parent: The parent of this node, defaults to None (root node).
-        :type parent: ast.AST, optional
+        The tree is traversed iteratively with an explicit stack, so deeply nested code does not hit the recursion limit.
         """
-        for child in ast.iter_child_nodes(node):
-            child.parent = node
-            self._assign_parents(child, node)
-    
-    def _lookup_function_calls(self, func_name: str) -> list[ast.Call]:
-        """
-        _lookup_function_calls Identifies all the function calls in the AST with the given function name.
+        self._func_defs: dict[str, ast.FunctionDef] = {}
+        self._class_defs: dict[str, ast.ClassDef] = {}
+        calls_by_name: defaultdict[str, list[ast.Call]] = defaultdict(list)
+        self._enclosing_func: dict[ast.Call, ast.FunctionDef | None] = {}
+        self._assigns: dict[ast.FunctionDef, AssignIndex] = {}
+        self._for_loops: dict[ast.FunctionDef, list[tuple[int, ast.For]]] = {}
+        self._global_assigns: AssignIndex = defaultdict(list)
+        self._global_for_loops: list[tuple[int, ast.For]] = []
 
-        :param func_name: The name of the function to look for in the AST.
-        :type func_name: str
-        :return: List of all the function calls in the AST with the given function name.
-        :rtype: list[ast.Call]
-        """
-        calls: list[ast.Call] = []
-        for node in ast.walk(self.ast):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == func_name:
-                calls.append(node)
-        return calls
+        # depth of the indexed definitions, so the shallowest definition of a name wins (e.g. a global function over a method)
+        func_depths: dict[str, int] = {}
+        class_depths: dict[str, int] = {}
+
+        # each entry is (node, parent, enclosing function or None at the global scope, depth)
+        stack: list[tuple[ast.AST, ast.AST | None, ast.FunctionDef | None, int]] = [(self.ast, None, None, 0)]
+        while stack:
+            node, parent, func, depth = stack.pop()
+
+            if func is None:
+                assigns, for_loops, scope = self._global_assigns, self._global_for_loops, self.ast
+            else:
+                assigns, for_loops, scope = self._assigns[func], self._for_loops[func], func
+
+            if isinstance(node, ast.FunctionDef):
+                if depth < func_depths.get(node.name, depth + 1):
+                    self._func_defs[node.name] = node
+                    func_depths[node.name] = depth
+                self._assigns[node] = defaultdict(list)
+                self._for_loops[node] = []
+            elif isinstance(node, ast.ClassDef):
+                if depth < class_depths.get(node.name, depth + 1):
+                    self._class_defs[node.name] = node
+                    class_depths[node.name] = depth
+            elif isinstance(node, ast.Call):
+                self._enclosing_func[node] = func
+                if isinstance(node.func, ast.Name):
+                    calls_by_name[node.func.id].append(node)
+            elif isinstance(node, ast.Assign):
+                # only the statements directly in a function body (or the global scope) are used for inference
+                if parent is scope and (isinstance(node.value, ast.Constant) or (isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name))):
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            assigns[target.id].append((node.lineno, node))
+            elif isinstance(node, ast.For):
+                if parent is scope and isinstance(node.iter, (ast.List, ast.Tuple, ast.Set)):
+                    for_loops.append((node.lineno, node))
+
+            child_func = node if isinstance(node, ast.FunctionDef) else func
+            # pushed in reverse so that the nodes are visited in source order
+            stack.extend((child, node, child_func, depth + 1) for child in reversed(list(ast.iter_child_nodes(node))))
+
+        for assigns in [self._global_assigns, *self._assigns.values()]:
+            for entries in assigns.values():
+                entries.sort(key=lambda entry: entry[0])
+        for for_loops in [self._global_for_loops, *self._for_loops.values()]:
+            for_loops.sort(key=lambda entry: entry[0])
+        # the call sites are frozen, so they can be handed out by _lookup_function_calls without copying
+        self._calls_by_name: dict[str, tuple[ast.Call, ...]] = {name: tuple(calls) for name, calls in calls_by_name.items()}
     
-    def _lookup_function_def(self, func_name: str) -> ast.FunctionDef:
+    def _lookup_function_calls(self, func_name: str) -> tuple[ast.Call, ...]:
         """
-        _lookup_function_def Finds the function definition node in the AST with the given function name.
+        _lookup_function_calls Identifies all the function calls in the AST with the given function name. The calls are collected once while indexing the AST, so repeated lookups of the same function return the same tuple.
 
         :param func_name: The name of the function to look for in the AST.
         :type func_name: str
-        :raises ValueError: If the function is not found in the AST.
-        :return: The function definition node in the AST with the given function name.
-        :rtype: ast.FunctionDef
+        :return: All the function calls in the AST with the given function name.
+        :rtype: tuple[ast.Call, ...]
         """
-        for node in ast.walk(self.ast):
-            if isinstance(node, ast.FunctionDef) and node.name == func_name:
-                return node
-        raise ValueError(f"Function {func_name} not found in the AST.")
-
+        return self._calls_by_name.get(func_name, ())
+    
     def check_types(self) -> None:
         """
         check_types Run the whole type checking process. This function checks if the function calls are made with the correct arguments and if the return types are correct. Internally this function calls other functions (e.g. _evaluate_arg, _find_var_types, etc.) to do the type checking.
         """
+        # the checks are pure python and hold the GIL, so checking the functions in a thread pool is not faster
         for func_name in self.type_assignments:
-            func_calls = self._lookup_function_calls(func_name)
-            for call in func_calls:
-                # get the calling function node
-                parent_func = None
-                call_i = call
-                while call_i and not isinstance(call_i, ast.FunctionDef):
-                    call_i = call_i.parent
-                parent_func = call_i
-
-                func_def = self._lookup_function_def(func_name)
-                args = {arg_def.arg: self._evaluate_arg(arg, parent_func) for arg, arg_def in zip(call.args, func_def.args.args)}
-                
-                for arg_name, arg_type in args.items():
-                    # print(arg_type)
-                    # print(self.type_assignments[func_name]['param_types'][arg_name])
-                    assert 'any' in arg_type or arg_type.issubset(self.type_assignments[func_name]['param_types'][arg_name]), f"In line {call.lineno}, function {func_name} called with wrong arguments., expected {self.type_assignments[func_name]['param_types'][arg_name]}, got {arg_type}"
+            self._check_function(func_name)
 
-                # print(self._get_func_return_type(func_name))
-                # print(self.type_assignments[func_name]['return_type'])
-                assert 'any' in arg_type or self._get_func_return_type(func_name).issubset(self.type_assignments[func_name]['return_type']), f"In line {call.lineno}, function {func_name} returned wrong type, expected {self.type_assignments[func_name]['return_type']}, got {self._get_func_return_type(func_name)}"
+    def _check_function(self, func_name: str) -> None:
+        """
+        _check_function Checks all the calls of one function against the types assigned to it.
+
+        :param func_name: The name of the function to check.
+        :type func_name: str
+        :raises AssertionError: If a call is made with wrong arguments or the function returns a wrong type.
+        """
+        # parameter types in the order of the function definition, so they line up with the call arguments
+        param_items = self.type_assignments[func_name]['param_items']
+        expected_return_type = self.type_assignments[func_name]['return_type']
+        func_calls = self._lookup_function_calls(func_name)
+        for call in func_calls:
+            # get the calling function node
+            parent_func = self._enclosing_func[call]
+
+            for arg, (arg_name, expected_type) in zip(call.args, param_items):
+                arg_type = self._evaluate_arg(arg, parent_func)
+                assert arg_type & ANY_MASK or not arg_type & ~expected_type, f"In line {call.lineno}, function {func_name} called with wrong arguments., expected {mask_to_names(expected_type)}, got {mask_to_names(arg_type)}"
+
+            return_type = self._get_func_return_type(func_name)
+            assert return_type & ANY_MASK or not return_type & ~expected_return_type, f"In line {call.lineno}, function {func_name} returned wrong type, expected {mask_to_names(expected_return_type)}, got {mask_to_names(return_type)}"
 
 
-    def _evaluate_arg(self, arg: ast.expr, parent_func: ast.FunctionDef | None) -> set[str]:
+    def _evaluate_arg(self, arg: ast.expr, parent_func: ast.FunctionDef | None) -> int:
         """
         _evaluate_arg Tries to find the type of an expression in the AST.
 
@@ -104,89 +245,46 @@ class TypeChecker:
         :param parent_func: The parent function of the expression. This is used to find the type of the variables in the function.
         :type parent_func: ast.FunctionDef | None
         :raises ValueError: If the type of the expression is not supported.
-        :return: The inferred type of the expression.
-        :rtype: set[str]
-        """
-        if isinstance(arg, ast.Constant):
-            return {self._get_constant_type(arg.value)}
-        elif isinstance(arg, ast.Name):
-            return self._find_var_type(arg.id, arg.lineno, parent_func)
-        elif isinstance(arg, ast.Call) and isinstance(arg.func, ast.Name):
-            return self._get_func_return_type(arg.func.id)
-        else:
-            raise ValueError(f"Unsupported variable type: {type(arg)}")
+        :return: The type mask of the inferred type of the expression (see :mod:`dtypetest.type_mask`).
+        :rtype: int
+        """
+        evaluator = self._arg_evaluators.get(parent_func)
+        if evaluator is None:
+            evaluator = self._arg_evaluators[parent_func] = _ArgEvaluator(self, parent_func)
+        return evaluator.visit(arg)
     
 
-    def _get_constant_type(self, value: Any) -> str:
+    def _get_constant_type(self, value: Any) -> int:
         """
         _get_constant_type Returns the type of the constant value. All python build-in types are supported and custom class objects are also supported.
 
         :param value: The constant value to find the type of. This is usually the value attribute of the ast.Constant node.
         :type value: Any
-        :raises ValueError: If the type of the constant is not supported.
-        :return: The type of the constant value.
-        :rtype: str
-        """
-        if isinstance(value, int):
-            return 'int'
-        elif isinstance(value, float):
-            return 'float'
-        elif isinstance(value, str):
-            return 'str'
-        elif isinstance(value, bool):
-            return 'bool'
-        elif value is None:
-            return 'None'
-        elif isinstance(value, bytes):
-            return 'bytes'
-        elif isinstance(value, list):
-            return 'list'
-        elif isinstance(value, tuple):
-            return 'tuple'
-        elif isinstance(value, dict):
-            return 'dict'
-        elif isinstance(value, set):
-            return 'set'
-        elif isinstance(value, frozenset):
-            return 'frozenset'
-        elif isinstance(value, complex):
-            return 'complex'
-        elif isinstance(value, range):
-            return 'range'
-        elif isinstance(value, slice):
-            return 'slice'
-        elif isinstance(value, memoryview):
-            return 'memoryview'
-        elif isinstance(value, type):
-            return 'type'
-        elif isinstance(value, object):
-            return 'object'
-        elif isinstance(value, type(None)):
-            return 'NoneType'
-        else:
-            raise ValueError(f"Unsupported constant type: {type(value)}")
+        :return: The type mask of the constant value, the 'object' type for any other object.
+        :rtype: int
+        """
+        # ast.Constant values are always of the exact built-in type, so no subclass checks are needed
+        return _CONST_TYPE_BITS.get(type(value), _OBJECT_BIT)
         
-    def _get_func_return_type(self, func_name: str) -> set[str]:
+    def _get_func_return_type(self, func_name: str) -> int:
         """
         _get_func_return_type Returns the possible return types of a function.
 
         :param func_name: The name of the function to find the return types of.
         :type func_name: str
         :raises ValueError: If the function is not found in the AST.
-        :return: The possible return types of the function.
-        :rtype: set[str]
-        """
-        func_node = None
-        for node in ast.walk(self.ast):
-            if isinstance(node, ast.FunctionDef) and node.name == func_name:
-                func_node = node
-                break
+        :return: The type mask of the possible return types of the function.
+        :rtype: int
+        """
+        if func_name in self._return_type_cache:
+            return self._return_type_cache[func_name]
+
+        func_node = self._func_defs.get(func_name)
         
         if not func_node:
             # check if the function is a constructor of a class
-            for node in ast.walk(self.ast):
-                if isinstance(node, ast.ClassDef) and node.name == func_name:
-                    return {func_name}
+            if func_name in self._class_defs:
+                return type_bit(func_name)
 
         if not func_node:
             raise ValueError(f"Function {func_name} not found in the AST.")
@@ -194,26 +292,27 @@ class TypeChecker:
         # get all the return statements in the function
         return_stmts = [stmt for stmt in func_node.body if isinstance(stmt, ast.Return)]
         if not return_stmts:
-            return {'None'}
+            self._return_type_cache[func_name] = _NONE_BIT
+            return self._return_type_cache[func_name]
         
-        possible_returns = set()
+        possible_returns = 0
         # get the return types of the function
         for stmt in return_stmts:
             if isinstance(stmt.value, ast.Constant):
-                possible_returns.add(self._get_constant_type(stmt.value.value))
+                possible_returns |= self._get_constant_type(stmt.value.value)
             elif isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name):
                 called_func_name = stmt.value.func.id
-                possible_returns.add(self._get_func_return_type(called_func_name))
+                possible_returns |= self._get_func_return_type(called_func_name)
         
         # check if the function ends without a return statement
-        if len(func_node.body) > return_stmts[-1].lineno:
-            if len(func_node.body) > return_stmts[-1].lineno:
-                possible_returns.add('None')
+        if not isinstance(func_node.body[-1], ast.Return):
+            possible_returns |= _NONE_BIT
             
+        self._return_type_cache[func_name] = possible_returns
         return possible_returns
 
 
-    def _find_var_type(self, var_name: str, start_line: int, func_node: ast.FunctionDef | None) -> set[str]:
+    def _find_var_type(self, var_name: str, start_line: int, func_node: ast.FunctionDef | None) -> int:
         """
         _find_var_type Finds the type of a variable in the AST. As python is a dynamically typed language, this function tries to infer the type of the variable by looking at the assignments and function calls.
 
@@ -224,24 +323,47 @@ class TypeChecker:
         :param func_node: The function ast node where the variable is used. None if the line is not inside a function.
         :type func_node: ast.FunctionDef | None
         :raises ValueError: If the variable or the parent function is not found in the AST.
-        :return: The inferred type of the variable.
-        :rtype: set[str]
-        """
-        for stmt in reversed(func_node.body if func_node else self.ast.body):
-            if stmt.lineno > start_line:
-                continue
-            if isinstance(stmt, ast.Assign) and any(isinstance(target, ast.Name) and target.id == var_name for target in stmt.targets):
-                if isinstance(stmt.value, ast.Constant):
-                    return {self._get_constant_type(stmt.value.value)}
-                elif isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name):
-                    called_func_name = stmt.value.func.id
-                    return self._get_func_return_type(called_func_name)
-            # see if variable is coming as iterator of loop
-            elif isinstance(stmt, ast.For) and (isinstance(stmt.iter, ast.List) or isinstance(stmt.iter, ast.Tuple) or isinstance(stmt.iter, ast.Set)):
-                return set(['any'])
+        :return: The type mask of the inferred type of the variable.
+        :rtype: int
+        """
+        key = (var_name, start_line, func_node)
+        if key not in self._var_type_cache:
+            self._var_type_cache[key] = self._infer_var_type(var_name, start_line, func_node)
+        return self._var_type_cache[key]
+
+    def _infer_var_type(self, var_name: str, start_line: int, func_node: ast.FunctionDef | None) -> int:
+        """
+        _infer_var_type Does the actual type inference for :meth:`dtypetest.type_checker.TypeChecker._find_var_type`, which caches the results of this function.
+
+        :param var_name: The name of the variable to find the type of.
+        :type var_name: str
+        :param start_line: The line number where the variable's type is to be inferred.
+        :type start_line: int
+        :param func_node: The function ast node where the variable is used. None if the line is not inside a function.
+        :type func_node: ast.FunctionDef | None
+        :raises ValueError: If the variable or the parent function is not found in the AST.
+        :return: The type mask of the inferred type of the variable.
+        :rtype: int
+        """
+        if func_node is None:
+            assigns, for_loops = self._global_assigns, self._global_for_loops
+        else:
+            assigns, for_loops = self._assigns[func_node], self._for_loops[func_node]
+        last_assign = _last_before(assigns.get(var_name, []), start_line)
+        last_loop = _last_before(for_loops, start_line)
+        # see if variable is coming as iterator of loop
+        if last_loop is not None and (last_assign is None or last_loop[0] > last_assign[0]):
+            return ANY_MASK
+        if last_assign is not None:
+            stmt = last_assign[1]
+            if isinstance(stmt.value, ast.Constant):
+                return self._get_constant_type(stmt.value.value)
+            elif isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name):
+                called_func_name = stmt.value.func.id
+                return self._get_func_return_type(called_func_name)
 
         # var_name could not be inferred from function body, check if it is a parameter
-        possible_types = set()
+        possible_types = 0
         if func_node is not None:
             param_pos = None
             for i, arg in enumerate(func_node.args.args):
@@ -251,16 +373,12 @@ class TypeChecker:
             if param_pos is not None:
                 parent_calls = self._lookup_function_calls(func_node.name)
                 for call in parent_calls:
-                    parent_parent = None
-                    call_i = call
-                    while not isinstance(call_i, ast.FunctionDef):
-                        call_i = call_i.parent
-                    parent_parent = call_i
+                    parent_parent = self._enclosing_func[call]
                     
                     if len(call.args) > param_pos:
                         possible_types |= self._evaluate_arg(call.args[param_pos], parent_parent)
                     else:
-                        raise ValueError(f"Parameter {var_name} not found in parent function call {parent_parent.name}")
+                        raise ValueError(f"Parameter {var_name} not found in function call in line {call.lineno}")
 
         if func_node is None or param_pos is None:
             possible_types |= self._find_global_var_type(var_name, start_line)
@@ -268,10 +386,10 @@ class TypeChecker:
         if possible_types:
             return possible_types
         else:
-            raise ValueError(f"Parameter {var_name} could not be inferred from function {func_node.name}")
+            raise ValueError(f"Variable {var_name} could not be inferred in line {start_line}")
         
         
-    def _find_global_var_type(self, var_name: str, start_line: int) -> set[str]:
+    def _find_global_var_type(self, var_name: str, start_line: int) -> int:
         """
         _find_global_var_type Finds the type of a global variable in the AST. This is called if the variable assignment is not found in any function scope. That means that the variable is initialized at the global scope (outside any function).
 
@@ -280,17 +398,16 @@ class TypeChecker:
         :param start_line: The line number where the variable is used. This is similar to the start_line parameter in :meth:`dtypetests.type_checker.TypeChecker._find_var_type`.
         :type start_line: int
         :raises ValueError: If the variable is not found in the AST.
-        :return: The inferred type of the variable.
-        :rtype: set[str]
-        """
-        for stmt in reversed(self.ast.body):
-            if stmt.lineno > start_line:
-                continue
-            if isinstance(stmt, ast.Assign) and any(isinstance(target, ast.Name) and target.id == var_name for target in stmt.targets):
-                if isinstance(stmt.value, ast.Constant):
-                    return {type(stmt.value.value).__name__}
-                elif isinstance(stmt.value, ast.Call) and isinstance(stmt.value.func, ast.Name):
-                    return self._evaluate_arg(stmt.value, None)
+        :return: The type mask of the inferred type of the variable.
+        :rtype: int
+        """
+        last_assign = _last_before(self._global_assigns.get(var_name, []), start_line)
+        if last_assign is not None:
+            stmt = last_assign[1]
+            if isinstance(stmt.value, ast.Constant):
+                return type_bit(type(stmt.value.value).__name__)
+            else:
+                return self._evaluate_arg(stmt.value, None)
                 
         raise ValueError(f"Variable {var_name} not found in the AST.")
 
@@ -0,0 +1,55 @@
+import threading
+from typing import Final, Iterable
+
+# bit position of each type name, new names (e.g. user classes) get the next free bit when they are first seen
+_TYPE_BIT: dict[str, int] = {}
+_TYPE_BIT_LOCK: Final = threading.Lock()
+
+
+def type_bit(name: str) -> int:
+    """
+    type_bit Returns the bit that represents a type in a type mask. Sets of types are stored as integers with one bit per type, so that unions and subset checks become single integer operations.
+
+    :param name: The name of the type (e.g. 'int', 'None' or the name of a class).
+    :type name: str
+    :return: An integer with only the bit of the type set.
+    :rtype: int
+    """
+    bit = _TYPE_BIT.get(name)
+    if bit is None:
+        with _TYPE_BIT_LOCK:
+            bit = _TYPE_BIT.setdefault(name, 1 << len(_TYPE_BIT))
+    return bit
+
+
+def names_to_mask(names: Iterable[str]) -> int:
+    """
+    names_to_mask Converts type names to a type mask.
+
+    :param names: The names of the types.
+    :type names: Iterable[str]
+    :return: The type mask with the bits of all the types set.
+    :rtype: int
+    """
+    mask = 0
+    for name in names:
+        mask |= type_bit(name)
+    return mask
+
+
+def mask_to_names(mask: int) -> set[str]:
+    """
+    mask_to_names Converts a type mask back to type names. This is only needed for error messages.
+
+    :param mask: The type mask.
+    :type mask: int
+    :return: The names of the types in the mask.
+    :rtype: set[str]
+    """
+    return {name for name, bit in list(_TYPE_BIT.items()) if mask & bit}
+
+
+# types that are always known, registered up front so they get the lowest bits
+ANY_MASK: Final = type_bit('any')
+for _name in ['None', 'int', 'float', 'str', 'bool', 'bytes', 'list', 'tuple', 'dict', 'set', 'frozenset', 'complex', 'range', 'slice', 'memoryview', 'type', 'object']:
+    type_bit(_name)
@@ -0,0 +1,5 @@
+def fun1(x):
+    print(x)
+
+
+fun1(True)
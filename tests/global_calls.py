@@ -0,0 +1,9 @@
+def fun1(x):
+    print(x)
+
+def fun2(y):
+    fun1(y)
+
+
+fun2(10)
+fun2('hello')
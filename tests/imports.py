@@ -0,0 +1,7 @@
+import simple
+from simple import fun1
+
+def fun3(z):
+    fun1(z)
+
+fun3(10)
@@ -0,0 +1,8 @@
+class A:
+    def fun1(self):
+        return 'x'
+
+def fun1(x):
+    return 5
+
+fun1(3)
@@ -0,0 +1,37 @@
+def ends_with_return(x):
+    print(x)
+    return 1
+
+def falls_through(x):
+    print(x)
+    return 1
+    print(x)
+
+
+ends_with_return(1)
+falls_through(1)
+
+
+def no_params():
+    return 1
+
+no_params()
+
+
+def outer(x):
+    print(x)
+    return no_params()
+
+outer(1)
+
+
+def identity(x):
+    return x
+
+def uses_global(v):
+    print(v)
+
+g = identity(1)
+
+def calls_with_global():
+    uses_global(g)
@@ -1,3 +1,5 @@
+import os
+import pathlib
 import pytest
 from dtypetest.dtypes import DTypes
 
@@ -42,4 +44,90 @@ def test_class_fun2(class_ast_obj: DTypes):
 def test_dynamic_for_fun1():
     d = DTypes('tests/dynamic_for_types.py')
     d.given('fun1', {'x': [int, str, float]}, None)
-    d.run()
\ No newline at end of file
+    d.run()
+
+def test_global_calls_fun1():
+    d = DTypes('tests/global_calls.py')
+    d.given('fun1', {'x': [int, str]}, None)
+    d.run()
+
+
+def test_imports_added_once():
+    d = DTypes('tests/imports.py')
+    assert len(d.ast.body) == 4 + len(DTypes('tests/simple.py').ast.body)
+    d.given('fun3', {'z': int}, None)
+    d.run()
+
+
+def test_simple_fun1_error_message(simple_ast_obj: DTypes):
+    simple_ast_obj.given('fun1', {'x': int}, None)
+    with pytest.raises(AssertionError, match=r"expected \{'int'\}"):
+        simple_ast_obj.run()
+
+
+def test_methods_global_function_wins():
+    d = DTypes('tests/methods.py')
+    d.given('fun1', {'x': int}, int)
+    d.run()
+
+
+def test_cached_ast_not_modified(simple_ast_obj: DTypes):
+    simple_ast_obj.given('fun1', {'x': int | str}, None)
+    simple_ast_obj.run()
+    assert not any(hasattr(node, 'parent') for node in simple_ast_obj.ast.body)
+
+
+def test_relative_path_cache(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    (tmp_path / 'tests').mkdir()
+    (tmp_path / 'tests' / 'simple.py').write_text("def other(x):\n    print(x)\n")
+    # same modification time, so only the path tells the two files apart
+    mtime_ns = pathlib.Path('tests/simple.py').stat().st_mtime_ns
+    os.utime(tmp_path / 'tests' / 'simple.py', ns=(mtime_ns, mtime_ns))
+    simple_body = DTypes('tests/simple.py').ast.body
+    monkeypatch.chdir(tmp_path)
+    assert DTypes('tests/simple.py').ast.body != simple_body
+
+
+@pytest.fixture
+def returns_ast_obj():
+    return DTypes('tests/returns.py')
+
+def test_returns_ends_with_return(returns_ast_obj: DTypes):
+    returns_ast_obj.given('ends_with_return', {'x': int}, int)
+    returns_ast_obj.run()
+
+def test_returns_falls_through(returns_ast_obj: DTypes):
+    returns_ast_obj.given('falls_through', {'x': int}, int)
+    with pytest.raises(AssertionError):
+        returns_ast_obj.run()
+
+def test_returns_falls_through_none(returns_ast_obj: DTypes):
+    returns_ast_obj.given('falls_through', {'x': int}, [int, None])
+    returns_ast_obj.run()
+
+def test_returns_no_params(returns_ast_obj: DTypes):
+    returns_ast_obj.given('no_params', {}, int)
+    returns_ast_obj.run()
+
+def test_returns_nested_call(returns_ast_obj: DTypes):
+    returns_ast_obj.given('outer', {'x': int}, int)
+    returns_ast_obj.run()
+
+def test_returns_uninferable_global(returns_ast_obj: DTypes):
+    returns_ast_obj.given('uses_global', {'v': int}, None)
+    with pytest.raises(ValueError, match="Variable g could not be inferred"):
+        returns_ast_obj.run()
+
+
+@pytest.fixture
+def constants_ast_obj():
+    return DTypes('tests/constants.py')
+
+def test_constants_bool(constants_ast_obj: DTypes):
+    constants_ast_obj.given('fun1', {'x': bool}, None)
+    constants_ast_obj.run()
+
+def test_constants_bool_not_int(constants_ast_obj: DTypes):
+    constants_ast_obj.given('fun1', {'x': int}, None)
+    with pytest.raises(AssertionError):
+        constants_ast_obj.run()